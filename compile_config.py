@@ -0,0 +1,26 @@
+import os
+import pprint
+
+import yaml
+
+# Use the libyaml C parser when available; falls back to the pure-Python one.
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def compile_config(config_path='config.yaml', output_path='config_compiled.py'):
+    """Precompile config.yaml into a Python module of plain literals.
+
+    load_config() in monitor_ioc.py imports the compiled module when it is
+    newer than config.yaml, so the IOC starts without parsing YAML at all.
+    Re-run this script (or just delete the output) after editing the YAML.
+    """
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f.read(), Loader=_Loader)
+
+    with open(output_path, 'w') as f:
+        f.write('# Generated by compile_config.py from %s -- do not edit by hand.\n' % config_path)
+        f.write('SOURCE_MTIME = %r\n\n' % os.path.getmtime(config_path))
+        f.write('CONFIG = %s\n' % pprint.pformat(config, width=100))
+    print(f"Compiled {config_path} -> {output_path}")
+
+if __name__ == "__main__":
+    compile_config()
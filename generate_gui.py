@@ -1,9 +1,36 @@
+import io
+
 import yaml
 
+# Use the libyaml C parser when available; falls back to the pure-Python one.
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Per-row snippets are emitted inside loops, so keep them as module-level
+# templates parsed once rather than re-built f-strings per iteration.
+_HEADER_LABEL_TEMPLATE = '''  <widget type="label" version="2.0.0">
+    <text>{text}</text><x>{x}</x><y>80</y><width>90</width><font><style>BOLD</style></font>
+  </widget>
+'''
+
+_ROW_TEMPLATE = '''  <widget type="template" version="2.0.0">
+    <file>row_template.bob</file><instances><instance><macros><PV>{pv}</PV><DESC>{desc}</DESC></macros></instance></instances>
+    <x>0</x><y>{y}</y><width>800</width><height>40</height>
+  </widget>
+'''
+
+_RECIPIENT_TEMPLATE = '''  <widget type="label" version="2.0.0"><text>Recipient {i}</text><x>50</x><y>{y}</y><width>100</width></widget>
+  <widget type="textentry" version="3.0.0">
+    <pv_name>{prefix}EMAIL:REC{i}:ADDR</pv_name><x>160</x><y>{y}</y><width>250</width><height>20</height>
+    <format>6</format>
+  </widget>
+  <widget type="combo" version="2.0.0"><pv_name>{prefix}EMAIL:REC{i}:ENABLE</pv_name><x>420</x><y>{y_combo}</y><width>100</width><height>30</height></widget>
+'''
+
 def generate_main_bob(config_path='config.yaml', output_path='main.bob'):
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-        
+    # Raw bytes straight to the parser; libyaml decodes UTF-8 itself
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f.read(), Loader=_Loader)
+
     pvs = config.get('target_pvs', {})
     prefix = config.get('prefix', 'MONITOR:')
 
@@ -12,62 +39,60 @@ def generate_main_bob(config_path='config.yaml', output_path='main.bob'):
     notification_height = 350
     total_height = 110 + base_rows_height + notification_height
 
-    xml = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<display version="2.0.0">',
-        '  <name>PVwatcher Dashboard</name>',
-        f'  <width>800</width><height>{total_height}</height>',
-        '  <widget type="rectangle" version="2.0.0">',
-        '    <width>800</width><height>60</height>',
-        '    <background_color><color name="Header_Background" red="200" green="200" blue="200"/></background_color>',
-        '  </widget>',
-        '  <widget type="label" version="2.0.0">',
-        '    <text>SYSTEM STATE:</text><x>10</x><y>15</y><width>150</width><font><size>18</size><style>BOLD</style></font>',
-        '  </widget>',
-        '  <widget type="multi_state_led" version="2.0.0">',
-        f'    <pv_name>{prefix}SUMMARY_STATUS</pv_name><x>170</x><y>20</y><width>20</width><height>20</height>',
-        '    <states>',
-        '      <state><value>0</value><label></label><color><color red="255" green="0" blue="0"/></color></state>',
-        '      <state><value>1</value><label></label><color><color red="0" green="255" blue="0"/></color></state>',
-        '      <state><value>2</value><label></label><color><color red="150" green="150" blue="150"/></color></state>',
-        '    </states>',
-        '  </widget>',
-        '  <widget type="combo" version="2.0.0">',
-        f'    <pv_name>{prefix}MASTER_ENABLE</pv_name><x>210</x><y>15</y><width>150</width><height>30</height>',
-        '    <items_from_pv>true</items_from_pv>',
-        '  </widget>'
-    ]
+    # Assemble the XML in a single StringIO buffer rather than a list of
+    # per-row strings joined at the end.
+    buf = io.StringIO()
+    buf.write(f'''<?xml version="1.0" encoding="UTF-8"?>
+<display version="2.0.0">
+  <name>PVwatcher Dashboard</name>
+  <width>800</width><height>{total_height}</height>
+  <widget type="rectangle" version="2.0.0">
+    <width>800</width><height>60</height>
+    <background_color><color name="Header_Background" red="200" green="200" blue="200"/></background_color>
+  </widget>
+  <widget type="label" version="2.0.0">
+    <text>SYSTEM STATE:</text><x>10</x><y>15</y><width>150</width><font><size>18</size><style>BOLD</style></font>
+  </widget>
+  <widget type="multi_state_led" version="2.0.0">
+    <pv_name>{prefix}SUMMARY_STATUS</pv_name><x>170</x><y>20</y><width>20</width><height>20</height>
+    <states>
+      <state><value>0</value><label></label><color><color red="255" green="0" blue="0"/></color></state>
+      <state><value>1</value><label></label><color><color red="0" green="255" blue="0"/></color></state>
+      <state><value>2</value><label></label><color><color red="150" green="150" blue="150"/></color></state>
+    </states>
+  </widget>
+  <widget type="combo" version="2.0.0">
+    <pv_name>{prefix}MASTER_ENABLE</pv_name><x>210</x><y>15</y><width>150</width><height>30</height>
+    <items_from_pv>true</items_from_pv>
+  </widget>
+''')
 
     # --- ALIGNED HEADERS ---
     headers = [
-        ("PV Name", 10), ("Description", 250), ("Value", 410), 
-        ("Enable", 500), ("Low", 600), ("High", 670), ("Status", 730)  
+        ("PV Name", 10), ("Description", 250), ("Value", 410),
+        ("Enable", 500), ("Low", 600), ("High", 670), ("Status", 730)
     ]
     for text, x_pos in headers:
-        xml.append(f'  <widget type="label" version="2.0.0">')
-        xml.append(f'    <text>{text}</text><x>{x_pos}</x><y>80</y><width>90</width><font><style>BOLD</style></font>')
-        xml.append('  </widget>')
+        buf.write(_HEADER_LABEL_TEMPLATE.format(text=text, x=x_pos))
 
     y_offset = 110
     # Generate Target PV Rows
     for pv, pv_info in pvs.items():
         desc = pv_info.get('desc', 'No Desc') if isinstance(pv_info, dict) else pv_info
-        xml.append(f'  <widget type="template" version="2.0.0">')
-        xml.append(f'    <file>row_template.bob</file><instances><instance><macros><PV>{pv}</PV><DESC>{desc}</DESC></macros></instance></instances>')
-        xml.append(f'    <x>0</x><y>{y_offset}</y><width>800</width><height>40</height>')
-        xml.append('  </widget>')
+        buf.write(_ROW_TEMPLATE.format(pv=pv, desc=desc, y=y_offset))
         y_offset += 40
 
     y_offset += 20 # Spacing
 
     # --- NOTIFICATION CONTROLS ---
-    xml.append('  <widget type="label" version="2.0.0">')
-    xml.append(f'    <text>NOTIFICATIONS</text><x>10</x><y>{y_offset}</y><width>200</width><font><size>16</size><style>BOLD</style></font>')
-    xml.append('  </widget>')
+    buf.write(f'''  <widget type="label" version="2.0.0">
+    <text>NOTIFICATIONS</text><x>10</x><y>{y_offset}</y><width>200</width><font><size>16</size><style>BOLD</style></font>
+  </widget>
+''')
     y_offset += 30
 
     # Master Slack
-    xml.append(f'''  <widget type="label" version="2.0.0"><text>Slack Alerts</text><x>10</x><y>{y_offset}</y><width>100</width></widget>
+    buf.write(f'''  <widget type="label" version="2.0.0"><text>Slack Alerts</text><x>10</x><y>{y_offset}</y><width>100</width></widget>
   <widget type="multi_state_led" version="2.0.0">
     <pv_name>{prefix}SLACK:STATUS</pv_name><x>120</x><y>{y_offset}</y><width>20</width><height>20</height>
     <states>
@@ -76,11 +101,12 @@ def generate_main_bob(config_path='config.yaml', output_path='main.bob'):
       <state><value>2</value><label></label><color><color red="150" green="150" blue="150"/></color></state>
     </states>
   </widget>
-  <widget type="combo" version="2.0.0"><pv_name>{prefix}SLACK:ENABLE</pv_name><x>160</x><y>{y_offset-5}</y><width>100</width><height>30</height></widget>''')
+  <widget type="combo" version="2.0.0"><pv_name>{prefix}SLACK:ENABLE</pv_name><x>160</x><y>{y_offset-5}</y><width>100</width><height>30</height></widget>
+''')
     y_offset += 40
 
     # Master Email
-    xml.append(f'''  <widget type="label" version="2.0.0"><text>Email Alerts</text><x>10</x><y>{y_offset}</y><width>100</width></widget>
+    buf.write(f'''  <widget type="label" version="2.0.0"><text>Email Alerts</text><x>10</x><y>{y_offset}</y><width>100</width></widget>
   <widget type="multi_state_led" version="2.0.0">
     <pv_name>{prefix}EMAIL:STATUS</pv_name><x>120</x><y>{y_offset}</y><width>20</width><height>20</height>
     <states>
@@ -89,34 +115,34 @@ def generate_main_bob(config_path='config.yaml', output_path='main.bob'):
       <state><value>2</value><label></label><color><color red="150" green="150" blue="150"/></color></state>
     </states>
   </widget>
-  <widget type="combo" version="2.0.0"><pv_name>{prefix}EMAIL:ENABLE</pv_name><x>160</x><y>{y_offset-5}</y><width>100</width><height>30</height></widget>''')
+  <widget type="combo" version="2.0.0"><pv_name>{prefix}EMAIL:ENABLE</pv_name><x>160</x><y>{y_offset-5}</y><width>100</width><height>30</height></widget>
+''')
     y_offset += 40
 
     # 6 Email Recipient Slots
     for i in range(1, 7):
-        xml.append(f'''  <widget type="label" version="2.0.0"><text>Recipient {i}</text><x>50</x><y>{y_offset}</y><width>100</width></widget>
-  <widget type="textentry" version="3.0.0">
-    <pv_name>{prefix}EMAIL:REC{i}:ADDR</pv_name><x>160</x><y>{y_offset}</y><width>250</width><height>20</height>
-    <format>6</format>
-  </widget>
-  <widget type="combo" version="2.0.0"><pv_name>{prefix}EMAIL:REC{i}:ENABLE</pv_name><x>420</x><y>{y_offset-5}</y><width>100</width><height>30</height></widget>''')
+        buf.write(_RECIPIENT_TEMPLATE.format(i=i, prefix=prefix, y=y_offset,
+                                             y_combo=y_offset - 5))
         y_offset += 35
 
     y_offset += 20
     # Last Update Block
-    xml.append('  <widget type="label" version="2.0.0">')
-    xml.append(f'    <text>Last Update:</text><x>10</x><y>{y_offset}</y><width>100</width><font><style>ITALIC</style></font>')
-    xml.append('  </widget>')
-    xml.append('  <widget type="textupdate" version="2.0.0">')
     f_pv = f"{prefix}LAST_UPDATE"
-    xml.append(f'    <pv_name>{f_pv}</pv_name><x>110</x><y>{y_offset}</y><width>200</width><height>20</height>')
-    xml.append('    <format>6</format>')
-    xml.append('    <background_color><color name="Read_Background" red="240" green="240" blue="240"/></background_color>')
-    xml.append('  </widget>')
-    xml.append('</display>')
-    
-    with open(output_path, 'w') as f:
-        f.write('\n'.join(xml))
+    buf.write(f'''  <widget type="label" version="2.0.0">
+    <text>Last Update:</text><x>10</x><y>{y_offset}</y><width>100</width><font><style>ITALIC</style></font>
+  </widget>
+  <widget type="textupdate" version="2.0.0">
+    <pv_name>{f_pv}</pv_name><x>110</x><y>{y_offset}</y><width>200</width><height>20</height>
+    <format>6</format>
+    <background_color><color name="Read_Background" red="240" green="240" blue="240"/></background_color>
+  </widget>
+</display>
+''')
+
+    # Encode once and write the whole file in a single binary write,
+    # bypassing the text layer's incremental encoder.
+    with open(output_path, 'wb') as f:
+        f.write(buf.getvalue().encode('utf-8'))
     print(f"Generated {output_path} with live Notification Controls.")
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 import asyncio
 import logging
+from array import array
 import yaml
 import os
+import sys
 import datetime
 import json
 import urllib.request
@@ -17,12 +19,31 @@ logger = logging.getLogger(__name__)
 os.environ['EPICS_CAS_AUTO_BEACON_ADDR_LIST'] = 'no'
 os.environ['EPICS_CAS_BEACON_ADDR_LIST'] = '127.0.0.1'
 
+# Use the libyaml C parser when available; falls back to the pure-Python one.
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 def load_config(config_path='config.yaml'):
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    # Prefer the module precompiled by compile_config.py: importing plain
+    # Python literals skips YAML parsing at startup entirely. Fall back to
+    # the YAML file when the compiled copy is missing or stale.
+    try:
+        import config_compiled
+        if config_compiled.SOURCE_MTIME >= os.path.getmtime(config_path):
+            return config_compiled.CONFIG
+        logger.warning("config_compiled.py is older than %s; re-parsing YAML", config_path)
+    except ImportError:
+        pass
+
+    # Hand the raw bytes straight to the parser; libyaml decodes UTF-8
+    # itself, skipping Python's text-mode layer
+    with open(config_path, 'rb') as f:
+        return yaml.load(f.read(), Loader=_Loader)
 
 CONFIG = load_config()
-TARGET_PVS = CONFIG.get('target_pvs', {})
+# Intern the target names: they are used as dict keys on every lookup, and
+# interned strings compare by identity on the hash-probe fast path
+TARGET_PVS = {sys.intern(str(pv)): info
+              for pv, info in CONFIG.get('target_pvs', {}).items()}
 
 # --- ALARM NOTIFICATION THREADS ---
 def send_slack_alert(webhook_url, message):
@@ -33,7 +54,7 @@ def send_slack_alert(webhook_url, message):
         urllib.request.urlopen(req, timeout=5.0)
         logger.info("Slack alert sent successfully.")
     except Exception as e:
-        logger.error(f"Slack notification failed: {e}")
+        logger.error("Slack notification failed: %s", e)
 
 def send_email_alert(email_cfg, live_recipients, subject, body):
     try:
@@ -46,9 +67,17 @@ def send_email_alert(email_cfg, live_recipients, subject, body):
         server = smtplib.SMTP(email_cfg.get('smtp_server'), email_cfg.get('smtp_port', 25))
         server.send_message(msg)
         server.quit()
-        logger.info(f"Email sent successfully to {len(live_recipients)} recipients.")
+        logger.info("Email sent successfully to %d recipients.", len(live_recipients))
     except Exception as e:
-        logger.error(f"Email notification failed: {e}")
+        logger.error("Email notification failed: %s", e)
+
+# Per-channel value extractors, chosen once per PV at connect time so the
+# hot monitor paths never re-probe the payload type.
+def _extract_scalar(data):
+    return data[0]
+
+def _extract_string(data):
+    return data[0].decode('utf-8', errors='ignore').strip('\x00')
 
 # --- CAPROTO LOGIC ---
 class RecipientRow(PVGroup):
@@ -75,11 +104,12 @@ class PVRow(PVGroup):
     high = pvproperty(value=1e9, name=":HIGH", dtype=float)
     status = pvproperty(value=1, name=":STATUS", dtype=int, read_only=True)
 
-    def __init__(self, pv_name, parent, low_limit, high_limit, *args, **kwargs):
+    def __init__(self, pv_name, parent, index, low_limit, high_limit, *args, **kwargs):
         escaped = pv_name.replace('{', '{{').replace('}', '}}')
         super().__init__(prefix=escaped, *args, **kwargs)
         self.pv_name = pv_name
         self.parent = parent
+        self.index = index
         self._init_low = low_limit
         self._init_high = high_limit
 
@@ -89,7 +119,8 @@ class PVRow(PVGroup):
 
     @low.putter
     async def low(self, instance, value):
-        asyncio.get_running_loop().call_later(0.05, lambda: asyncio.create_task(self.parent.trigger_logic(self.pv_name)))
+        self.parent._lows[self.index] = float(value)
+        self.parent.trigger_logic(self.pv_name)
         return value
 
     @high.startup
@@ -98,14 +129,16 @@ class PVRow(PVGroup):
 
     @high.putter
     async def high(self, instance, value):
-        asyncio.get_running_loop().call_later(0.05, lambda: asyncio.create_task(self.parent.trigger_logic(self.pv_name)))
+        self.parent._highs[self.index] = float(value)
+        self.parent.trigger_logic(self.pv_name)
         return value
 
     @enable.putter
     async def enable(self, instance, value):
         if isinstance(value, bytes): value = value.decode().strip('\x00')
         clean_val = 0 if str(value).upper() in ["0", "DISABLE"] else 1
-        asyncio.get_running_loop().call_later(0.05, lambda: asyncio.create_task(self.parent.trigger_logic(self.pv_name)))
+        self.parent._enables[self.index] = clean_val
+        self.parent.trigger_logic(self.pv_name)
         return clean_val
 
 
@@ -125,10 +158,46 @@ class PVWatcherIOC(PVGroup):
         super().__init__(prefix=prefix, *args, **kwargs)
         self.master_prefix = prefix
         self.target_pvs = target_pvs
-        self.pv_data = {pv: {"value": None} for pv in target_pvs}
+        # Flat value storage: one list slot per target, addressed by a
+        # fixed index assigned at startup
+        self._target_index = {name: i for i, name in enumerate(target_pvs)}
+        self.target_values = [None] * len(target_pvs)
+        # Normalize the static per-target YAML metadata once: the expected
+        # state (already lowercased, None for numeric targets) and the
+        # description used in alerts
+        self._expected = {}
+        self._descs = {}
+        for pv, pv_info in target_pvs.items():
+            if isinstance(pv_info, dict):
+                self._expected[pv] = (str(pv_info['expected']).strip().lower()
+                                      if 'expected' in pv_info else None)
+                self._descs[pv] = pv_info.get('desc', 'Unknown System')
+            else:
+                self._expected[pv] = None
+                self._descs[pv] = str(pv_info)
         self.rows = {}
-        self.previous_states = {pv: None for pv in target_pvs}
+        # Last computed row status per target, index-aligned with
+        # target_values (None until the first evaluation)
+        self.previous_states = [None] * len(target_pvs)
+        # Names of enabled targets currently in fault, maintained
+        # incrementally by update_logic so the summary check is O(1).
+        self._alarm_set = set()
+        # Plain-int mirror of summary_status; None forces the first write
+        self._cached_summary_status = None
         
+        # SoA mirrors of the per-row settings, index-aligned with
+        # target_values: contiguous C arrays the hot paths read directly,
+        # kept in sync by the PVRow putters. The pvproperties stay as the
+        # EPICS-facing interface.
+        n_targets = len(target_pvs)
+        self._enables = array('b', [1] * n_targets)
+        self._lows = array('d', [-1e9] * n_targets)
+        self._highs = array('d', [1e9] * n_targets)
+
+        # Collect every child pvdb and merge them into ours in one pass at
+        # the end, instead of one dict.update per row/recipient
+        child_pvdb = {}
+
         # 1. Initialize the Target PV Rows
         for pv in target_pvs:
             pv_info = target_pvs[pv]
@@ -138,9 +207,13 @@ class PVWatcherIOC(PVGroup):
             else:
                 init_low, init_high = -1e9, 1e9
 
-            row = PVRow(pv_name=pv, parent=self, low_limit=init_low, high_limit=init_high)
+            idx = self._target_index[pv]
+            self._lows[idx] = init_low
+            self._highs[idx] = init_high
+            row = PVRow(pv_name=pv, parent=self, index=idx,
+                        low_limit=init_low, high_limit=init_high)
             self.rows[pv] = row
-            self.pvdb.update(row.pvdb)
+            child_pvdb.update(row.pvdb)
 
         # 2. Initialize the 6 Email Recipient Slots
         yaml_emails = CONFIG.get('email_alerts', {}).get('recipients', [])
@@ -151,12 +224,29 @@ class PVWatcherIOC(PVGroup):
             # Prepend the master prefix so they show up correctly in EPICS
             rec_prefix = f"{self.master_prefix}EMAIL:REC{i}"
             rec_row = RecipientRow(prefix=rec_prefix, init_address=addr, init_enable=en)
-            self.pvdb.update(rec_row.pvdb)
+            child_pvdb.update(rec_row.pvdb)
             self.recipients.append(rec_row)
 
+        self.pvdb.update(child_pvdb)
+
         # 3. Setup Master Toggles from YAML
-        self._init_slack = 1 if CONFIG.get('slack_alerts', {}).get('enabled') else 0
-        self._init_email = 1 if CONFIG.get('email_alerts', {}).get('enabled') else 0
+        # Snapshot the static alert config once; it never changes at runtime
+        self._slack_cfg = CONFIG.get('slack_alerts', {})
+        self._email_cfg = CONFIG.get('email_alerts', {})
+        self._has_webhook = bool(self._slack_cfg.get('webhook_url'))
+        self._has_smtp = bool(self._email_cfg.get('smtp_server'))
+        self._init_slack = 1 if self._slack_cfg.get('enabled') else 0
+        self._init_email = 1 if self._email_cfg.get('enabled') else 0
+
+        # Created once the event loop is running (see summary_status.startup)
+        self._summary_dirty = None
+        self._logic_dirty = None
+        self._pending_logic = set()
+
+    def mark_summary_dirty(self):
+        """Request a summary recompute; a burst of calls coalesces into one pass."""
+        if self._summary_dirty is not None:
+            self._summary_dirty.set()
 
     @slack_enable.startup
     async def slack_enable(self, instance, async_lib):
@@ -164,7 +254,7 @@ class PVWatcherIOC(PVGroup):
 
     @slack_enable.putter
     async def slack_enable(self, instance, value):
-        asyncio.get_running_loop().call_later(0.1, lambda: asyncio.create_task(self.update_summary()))
+        self.mark_summary_dirty()
         return value
 
     @email_enable.startup
@@ -173,7 +263,7 @@ class PVWatcherIOC(PVGroup):
 
     @email_enable.putter
     async def email_enable(self, instance, value):
-        asyncio.get_running_loop().call_later(0.1, lambda: asyncio.create_task(self.update_summary()))
+        self.mark_summary_dirty()
         return value
 
     @master_enable.putter
@@ -182,57 +272,101 @@ class PVWatcherIOC(PVGroup):
         clean_val = 0 if str(value).upper() in ["0", "OFF", "SYSTEM OFF"] else 1
         async def delayed_trigger():
             await asyncio.sleep(0.05)
-            for pv_name in self.target_pvs: await self.trigger_logic(pv_name)
-            await self.update_summary()
+            for pv_name in self.target_pvs: self.trigger_logic(pv_name)
+            # Rebuild the alarm set in one pass so the summary is correct
+            # right away; the queued per-row passes update the LEDs/alerts
+            self._recompute_alarm_set()
+            self.mark_summary_dirty()
         asyncio.create_task(delayed_trigger())
         return clean_val
 
-    async def trigger_logic(self, pv_name):
-        asyncio.get_running_loop().call_soon(lambda: asyncio.create_task(self.update_logic(pv_name)))
+    def _recompute_alarm_set(self):
+        """Rebuild _alarm_set in a single pass over the flat arrays.
+
+        Used after global transitions (master toggle) where every target
+        changes state at once; the loop touches only local references and
+        the contiguous enable/low/high buffers.
+        """
+        alarms = set()
+        if self.master_enable.value not in [0, "0", "SYSTEM OFF"]:
+            enables, lows, highs = self._enables, self._lows, self._highs
+            values, expected = self.target_values, self._expected
+            for name, i in self._target_index.items():
+                if not enables[i]:
+                    continue
+                v = values[i]
+                if v is None:
+                    alarms.add(name)
+                elif expected[name] is not None:
+                    if str(v).strip().lower() != expected[name]:
+                        alarms.add(name)
+                else:
+                    try:
+                        if not (lows[i] <= float(v) <= highs[i]):
+                            alarms.add(name)
+                    except Exception:
+                        alarms.add(name)
+        self._alarm_set = alarms
+
+    def trigger_logic(self, pv_name):
+        """Queue a row re-evaluation; repeated puts to one row coalesce."""
+        self._pending_logic.add(pv_name)
+        if self._logic_dirty is not None:
+            self._logic_dirty.set()
+
+    def _on_update(self, sub, response):
+        """Shared subscription callback for all passively monitored PVs."""
+        pv_name = sub.pv.name
+        try:
+            self.target_values[sub._target_idx] = self._extractors[pv_name](response.data)
+            self.trigger_logic(pv_name)
+        except Exception as e:
+            logger.error("Callback error for %s: %s", pv_name, e)
 
     async def update_logic(self, pv_name):
         row = self.rows[pv_name]
-        val = self.pv_data[pv_name]["value"]
-        
-        out_of_bounds = True
-        if val is not None:
-            pv_info = self.target_pvs.get(pv_name, {})
-            
-            # --- Exact Text/State Matching ---
-            if isinstance(pv_info, dict) and 'expected' in pv_info:
-                expected_val = str(pv_info['expected']).strip().lower()
-                
-                # Safely decode Caproto byte strings if necessary
-                live_val = val
-                if isinstance(live_val, bytes):
-                    live_val = live_val.decode('utf-8', errors='ignore').strip('\x00')
-                
-                live_val = str(live_val).strip().lower()
-                out_of_bounds = (live_val != expected_val)
-                
-                # --- NEW DEBUG LINE ---
-                logger.info(f"[{pv_name}] MATCH CHECK | Live: '{live_val}' | Expected: '{expected_val}' | Faulted: {out_of_bounds}")
-                
-            # --- Numerical Bounds Checking ---
-            else:
-                try:
-                    out_of_bounds = not (float(row.low.value) <= float(val) <= float(row.high.value))
-                except Exception:
-                    out_of_bounds = True
+        idx = self._target_index[pv_name]
+        val = self.target_values[idx]
 
+        # Check the toggles first: a bypassed row needs no bounds work
         master_off = self.master_enable.value in [0, "0", "SYSTEM OFF"]
-        row_off = row.enable.value in [0, "0", "Disable"]
+        row_off = not self._enables[idx]
 
-        if master_off or row_off: new_status = 2
-        elif val is None or out_of_bounds: new_status = 0
-        else: new_status = 1
-            
-        old_status = self.previous_states.get(pv_name)
+        if master_off or row_off:
+            new_status = 2
+        else:
+            out_of_bounds = True
+            if val is not None:
+                expected_val = self._expected[pv_name]
+
+                # --- Exact Text/State Matching ---
+                if expected_val is not None:
+                    # Byte strings were already decoded by the channel extractor
+                    live_val = str(val).strip().lower()
+                    out_of_bounds = (live_val != expected_val)
+
+                    # --- NEW DEBUG LINE ---
+                    logger.debug("[%s] MATCH CHECK | Live: '%s' | Expected: '%s' | Faulted: %s", pv_name, live_val, expected_val, out_of_bounds)
+
+                # --- Numerical Bounds Checking ---
+                else:
+                    try:
+                        out_of_bounds = not (self._lows[idx] <= float(val) <= self._highs[idx])
+                    except Exception:
+                        out_of_bounds = True
+
+            new_status = 0 if (val is None or out_of_bounds) else 1
+
+        if new_status == 0:
+            self._alarm_set.add(pv_name)
+        else:
+            self._alarm_set.discard(pv_name)
+
+        old_status = self.previous_states[idx]
         if old_status is not None and new_status != old_status:
             
             # Extract description for alerts
-            pv_info = self.target_pvs.get(pv_name, {})
-            desc = pv_info.get('desc', 'Unknown System') if isinstance(pv_info, dict) else str(pv_info)
+            desc = self._descs[pv_name]
 
             alert_msg = None
             subject = None
@@ -247,14 +381,12 @@ class PVWatcherIOC(PVGroup):
             if alert_msg:
                 # 1. Dispatch Slack
                 slack_on = self.slack_enable.value in [1, "1", "Enable"]
-                slack_cfg = CONFIG.get('slack_alerts', {})
-                if slack_on and slack_cfg.get('webhook_url'):
-                    asyncio.create_task(asyncio.to_thread(send_slack_alert, slack_cfg['webhook_url'], alert_msg))
-                
+                if slack_on and self._has_webhook:
+                    asyncio.create_task(asyncio.to_thread(send_slack_alert, self._slack_cfg['webhook_url'], alert_msg))
+
                 # 2. Dispatch Email
                 email_on = self.email_enable.value in [1, "1", "Enable"]
-                email_cfg = CONFIG.get('email_alerts', {})
-                if email_on and email_cfg.get('smtp_server'):
+                if email_on and self._has_smtp:
                     live_emails = []
                     for r in self.recipients:
                         if r.enable.value in [1, "1", "Enable"]:
@@ -262,11 +394,11 @@ class PVWatcherIOC(PVGroup):
                             if addr: live_emails.append(addr)
                     
                     if live_emails:
-                        asyncio.create_task(asyncio.to_thread(send_email_alert, email_cfg, live_emails, subject, alert_msg))
+                        asyncio.create_task(asyncio.to_thread(send_email_alert, self._email_cfg, live_emails, subject, alert_msg))
 
-        self.previous_states[pv_name] = new_status
+        self.previous_states[idx] = new_status
         await row.status.write(new_status)
-        await self.update_summary()
+        self.mark_summary_dirty()
 
     async def update_summary(self):
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -274,107 +406,130 @@ class PVWatcherIOC(PVGroup):
 
         # Update Master Notification LEDs
         slack_on = self.slack_enable.value in [1, "1", "Enable"]
-        has_webhook = bool(CONFIG.get('slack_alerts', {}).get('webhook_url'))
-        await self.slack_status.write(1 if (slack_on and has_webhook) else (2 if not slack_on else 0))
+        await self.slack_status.write(1 if (slack_on and self._has_webhook) else (2 if not slack_on else 0))
 
         email_on = self.email_enable.value in [1, "1", "Enable"]
-        has_smtp = bool(CONFIG.get('email_alerts', {}).get('smtp_server'))
-        await self.email_status.write(1 if (email_on and has_smtp) else (2 if not email_on else 0))
+        await self.email_status.write(1 if (email_on and self._has_smtp) else (2 if not email_on else 0))
 
+        # update_logic keeps _alarm_set current per target (it re-runs on
+        # value, limit and enable changes), so the rollup is O(1) here.
         master_off = self.master_enable.value in [0, "0", "SYSTEM OFF"]
-        if master_off:
-            await self.summary_status.write(2)
-            return
-        
-        overall = 1
-        for pv_name, row in self.rows.items():
-            row_on = row.enable.value in [1, "1", "Enable"]
-            if row_on:
-                val = self.pv_data[pv_name]["value"]
-                out_of_bounds = True
-                if val is not None:
-                    try:
-                        out_of_bounds = not (float(row.low.value) <= float(val) <= float(row.high.value))
-                    except Exception:
-                        out_of_bounds = True
-                if val is None or out_of_bounds:
-                    overall = 0
-                    break
-                    
-        await self.summary_status.write(overall)
+        new_status = 2 if master_off else (0 if self._alarm_set else 1)
+
+        # Compare against a plain int rather than the pvproperty's .value,
+        # and skip the channel write pipeline when the status is unchanged
+        if new_status != self._cached_summary_status:
+            self._cached_summary_status = new_status
+            await self.summary_status.write(new_status)
 
     @summary_status.startup
     async def summary_status(self, instance, async_lib):
         self.client_ctx = Context()
         self.polled_pvs = {}
         self.subscriptions = []
+        self._extractors = {}
+
+        # Single long-lived consumer: bursts of mark_summary_dirty() calls
+        # collapse into one update_summary() pass after a short settle window.
+        self._summary_dirty = asyncio.Event()
+
+        async def summary_consumer():
+            while True:
+                await self._summary_dirty.wait()
+                self._summary_dirty.clear()
+                await asyncio.sleep(0.05)
+                await self.update_summary()
+
+        asyncio.create_task(summary_consumer())
+
+        # Same pattern for row re-evaluations queued by the limit/enable
+        # putters: drain the pending set once per settle window instead of
+        # allocating a timer plus a Task per put.
+        self._logic_dirty = asyncio.Event()
+
+        async def logic_consumer():
+            while True:
+                await self._logic_dirty.wait()
+                self._logic_dirty.clear()
+                await asyncio.sleep(0.05)
+                pending, self._pending_logic = self._pending_logic, set()
+                for name in pending:
+                    await self.update_logic(name)
+
+        asyncio.create_task(logic_consumer())
 
         # 1. Establish the connections at boot
         for req_pv_name in self.target_pvs:
+            idx = self._target_index[req_pv_name]
             try:
                 found = await self.client_ctx.get_pvs(req_pv_name, timeout=2.0)
                 pv_obj = found[0]
-                
-                # Do an initial read to populate the GUI immediately
+
+                # Do an initial read to populate the GUI immediately, and
+                # pick the extractor for this channel from the first payload
                 init_resp = await pv_obj.read(timeout=1.0)
-                self.pv_data[req_pv_name]["value"] = init_resp.data[0]
+                if isinstance(init_resp.data[0], bytes):
+                    extract = _extract_string
+                else:
+                    extract = _extract_scalar
+                self._extractors[req_pv_name] = extract
+                self.target_values[idx] = extract(init_resp.data)
                 await self.update_logic(req_pv_name)
                 
-                pv_info = self.target_pvs.get(req_pv_name, {})
-                
                 # 2. Sort into Polled (State/Expected) vs Subscribed (Numerical/Bounds)
-                if isinstance(pv_info, dict) and 'expected' in pv_info:
+                if self._expected[req_pv_name] is not None:
                     # Add to the active polling list
-                    self.polled_pvs[req_pv_name] = pv_obj
-                    logger.info(f"[{req_pv_name}] Configured for Active Polling (State PV)")
+                    self.polled_pvs[req_pv_name] = (idx, pv_obj)
+                    logger.info("[%s] Configured for Active Polling (State PV)", req_pv_name)
                 else:
-                    # Setup native Caproto passive subscription
-                    def make_callback(name_key):
-                        def callback(sub, response):
-                            try:
-                                self.pv_data[name_key]["value"] = response.data[0]
-                                asyncio.get_running_loop().create_task(self.update_logic(name_key))
-                            except Exception as e:
-                                logger.error(f"Callback error for {name_key}: {e}")
-                        return callback
-
+                    # Setup native Caproto passive subscription; one shared
+                    # callback serves every subscription
                     sub = pv_obj.subscribe()
-                    sub.add_callback(make_callback(req_pv_name))
+                    sub._target_idx = idx
+                    sub.add_callback(self._on_update)
                     self.subscriptions.append(sub)
-                    logger.info(f"[{req_pv_name}] Configured for Passive Subscription (Numeric PV)")
+                    logger.info("[%s] Configured for Passive Subscription (Numeric PV)", req_pv_name)
                     
             except Exception as e:
-                logger.warning(f"Failed to connect to {req_pv_name}: {e}")
+                logger.warning("Failed to connect to %s: %s", req_pv_name, e)
+                # Record the fault so the row LED and summary reflect it
+                await self.update_logic(req_pv_name)
                 
         # 3. Start the Active Polling Loop ONLY for the state PVs
         if self.polled_pvs:
             async def poll_pvs():
                 while True:
                     await asyncio.sleep(0.5)  # Scan twice a second
-                    for pv_name, pv_obj in self.polled_pvs.items():
+                    for pv_name, (idx, pv_obj) in self.polled_pvs.items():
                         try:
                             resp = await pv_obj.read(timeout=0.5)
-                            live_val = resp.data[0]
-                            
+                            live_val = self._extractors[pv_name](resp.data)
+
                             # Only trigger the heavy logic if the physical value actually changed
-                            if self.pv_data[pv_name]["value"] != live_val:
-                                self.pv_data[pv_name]["value"] = live_val
-                                asyncio.create_task(self.update_logic(pv_name))
-                                
+                            if self.target_values[idx] != live_val:
+                                self.target_values[idx] = live_val
+                                self.trigger_logic(pv_name)
+
                         except Exception:
                             # If the network drops, set it to None to instantly trigger a Fault alert
-                            if self.pv_data[pv_name]["value"] is not None:
-                                self.pv_data[pv_name]["value"] = None
-                                asyncio.create_task(self.update_logic(pv_name))
+                            if self.target_values[idx] is not None:
+                                self.target_values[idx] = None
+                                self.trigger_logic(pv_name)
 
             # Launch the background loop
             asyncio.create_task(poll_pvs())
 
+        # Kick off one pass to cover anything that came in before the
+        # consumers existed (e.g. putters fired by other startup hooks).
+        if self._pending_logic:
+            self._logic_dirty.set()
+        self._summary_dirty.set()
+
 if __name__ == "__main__":
     if not TARGET_PVS:
         logger.error("No PVs found in config.yaml")
     else:
         custom_prefix = CONFIG.get('prefix', 'MONITOR:')
         ioc = PVWatcherIOC(target_pvs=TARGET_PVS, prefix=custom_prefix)
-        logger.info(f"Starting PVwatcher with Prefix: {custom_prefix}")
+        logger.info("Starting PVwatcher with Prefix: %s", custom_prefix)
         run(ioc.pvdb)